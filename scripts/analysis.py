@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from load_clean import load_and_clean
 
@@ -17,10 +18,12 @@ def _extract_orders_df(raw) -> pd.DataFrame:
         return raw
 
     if isinstance(raw, dict):
-        if "orders" in raw and isinstance(raw["orders"], pd.DataFrame):
-            return raw["orders"]
-        if "df" in raw and isinstance(raw["df"], pd.DataFrame):
-            return raw["df"]
+        df = next(
+            (raw[k] for k in ("orders", "df") if isinstance(raw.get(k), pd.DataFrame)),
+            None,
+        )
+        if df is not None:
+            return df
         raise TypeError(
             f"load_and_clean() returned a dict, but no 'orders' or 'df' "
             f"DataFrame was found. Keys: {list(raw.keys())}"
@@ -31,12 +34,27 @@ def _extract_orders_df(raw) -> pd.DataFrame:
     )
 
 
-def process_dataset(folder_path: str) -> dict:
+def _fast_nunique(s: pd.Series) -> int:
+    """
+    Count distinct non-null values in `s`.
+
+    For a categorical the count comes from its integer codes (one bincount
+    over the codes, -1 marking missing values) instead of hashing every row
+    again; unused categories are not counted.
+    """
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        codes = s.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(s.cat.categories))
+        return int(np.count_nonzero(counts))
+    return int(s.nunique())
+
+
+def process_dataset(folder_path: str, include_df: bool = True) -> dict:
     """
     Load + clean dataset and compute metrics for the dashboard.
 
     Returns dict with keys:
-      - df
+      - df             (only if include_df is true)
       - daily_revenue  (DataFrame[date, revenue_usd])
       - top5_days      (DataFrame[date, revenue_usd])
       - unique_users   (int)
@@ -53,59 +71,72 @@ def process_dataset(folder_path: str) -> dict:
     if df.empty:
         raise ValueError("Dataset is empty")
 
-    daily_revenue = (
-        df.groupby("date", as_index=False)["revenue_usd"]
-        .sum()
-        .sort_values("date")
+    # Only these columns feed the metrics below; grouping a narrow frame
+    # keeps the unrelated order columns out of every aggregation pass.
+    work_cols = [
+        c
+        for c in ("date", "revenue_usd", "author_set", "user_key", "user_id")
+        if c in df.columns
+    ]
+    # Group on integer category codes instead of hashing every string row.
+    work = df[work_cols].astype(
+        {c: "category" for c in ("user_key", "author_set") if c in work_cols}
     )
+    if "author_set" in work_cols:
+        # load_and_clean delivers author_set with the whole catalog as
+        # categories; keep only the authors that were actually ordered.
+        work["author_set"] = work["author_set"].cat.remove_unused_categories()
 
-    top5_days = (
-        daily_revenue.sort_values("revenue_usd", ascending=False)
-        .head(5)
-        .reset_index(drop=True)
-    )
+    # groupby already returns the dates in ascending order.
+    daily_revenue = work.groupby("date", as_index=False)["revenue_usd"].sum()
 
-    unique_users = int(df["user_key"].nunique())
+    top5_days = daily_revenue.nlargest(5, "revenue_usd").reset_index(drop=True)
 
-    if "author_set" in df.columns:
-        unique_author_sets = int(df["author_set"].dropna().nunique())
+    unique_users = _fast_nunique(work["user_key"])
 
-        author_rev = (
-            df.dropna(subset=["author_set"])
-            .groupby("author_set")["revenue_usd"]
-            .sum()
-            .sort_values(ascending=False)
-        )
+    if "author_set" in work.columns:
+        unique_author_sets = _fast_nunique(work["author_set"])
+
+        # groupby drops rows with a missing author_set key on its own.
+        author_rev = work.groupby("author_set", observed=True, sort=False)[
+            "revenue_usd"
+        ].sum()
 
-        popular_authors = author_rev.head(3).index.tolist()
+        popular_authors = author_rev.nlargest(3).index.tolist()
     else:
         unique_author_sets = 0
         popular_authors = []
 
-    user_rev = (
-        df.groupby("user_key")["revenue_usd"]
-        .sum()
-        .sort_values(ascending=False)
-    )
+    user_rev = work.groupby("user_key", observed=True, sort=False)[
+        "revenue_usd"
+    ].sum()
 
     if user_rev.empty:
         best_buyer_key = None
         best_buyer_revenue = 0.0
         best_buyer_aliases = []
     else:
-        best_buyer_key = str(user_rev.index[0])
-        best_buyer_revenue = float(user_rev.iloc[0])
-
+        best_key = user_rev.idxmax()
+        best_buyer_key = str(best_key)
+        best_buyer_revenue = float(user_rev.loc[best_key])
+
+        # Select the best buyer's rows by comparing integer category codes;
+        # get_group would build the row indices of every user first.
+        user_key = work["user_key"]
+        is_best = (
+            user_key.cat.codes.to_numpy()
+            == user_key.cat.categories.get_loc(best_key)
+        )
         best_buyer_aliases = (
-            df.loc[df["user_key"] == user_rev.index[0], "user_id"]
-            .astype(str)
+            work["user_id"][is_best]
+            .astype("string[pyarrow]")
             .dropna()
             .unique()
             .tolist()
         )
         best_buyer_aliases = sorted(best_buyer_aliases)
 
-    return {
+    result = {
         "df": df,
         "daily_revenue": daily_revenue,
         "top5_days": top5_days,
@@ -116,3 +147,6 @@ def process_dataset(folder_path: str) -> dict:
         "best_buyer_revenue": best_buyer_revenue,
         "best_buyer_aliases": best_buyer_aliases,
     }
+    if not include_df:
+        del result["df"]
+    return result
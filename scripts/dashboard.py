@@ -1,7 +1,10 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import streamlit as st
 from analysis import process_dataset
+from load_clean import dataset_file_kind
 
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 
@@ -36,15 +39,88 @@ def _to_df(obj):
     return None
 
 
-def render_dataset(name: str, folder: str):
-    st.header(f"Results for {name}")
+def _folder_signature(folder: str) -> tuple:
+    """
+    Names and modification times of the input files in a dataset folder.
 
+    Only the files load_and_clean reads count; the books cache it writes next
+    to them would otherwise change the signature on the first run.
+    """
     try:
-        result = process_dataset(folder)
-    except Exception as e:
-        st.error(f"Error while processing {name}: {e}")
+        entries = list(os.scandir(folder))
+    except OSError:
+        return ()
+    return tuple(
+        sorted(
+            (entry.name, entry.stat().st_mtime_ns)
+            for entry in entries
+            if dataset_file_kind(entry.name)
+        )
+    )
+
+
+class _CacheMiss(Exception):
+    """Raised by _cached_process when it is called without a job to run."""
+
+
+@st.cache_data(show_spinner=False)
+def _cached_process(folder: str, signature: tuple, _job=None) -> dict:
+    """
+    Result of process_dataset() for one folder, memoized across reruns.
+
+    `signature` is only used as part of the cache key, so editing an input
+    file of the folder invalidates its cached result. `_job` is a future for
+    the computation and is not hashed; called without one, a cache miss
+    raises _CacheMiss. Exceptions are never cached, so a failed dataset is
+    retried on the next rerun.
+    """
+    if _job is None:
+        raise _CacheMiss(folder)
+    return _job.result()
+
+
+def _load_results() -> dict:
+    """
+    Map dataset name -> result dict, or -> the exception it raised.
+
+    Cached folders are answered from the cache; the rest are independent and
+    CPU-bound, so each one runs in its own worker process.
+    """
+    keys = {
+        name: (folder, _folder_signature(folder)) for name, folder in DATASETS.items()
+    }
+    results = {}
+    misses = []
+    for name, (folder, signature) in keys.items():
+        try:
+            results[name] = _cached_process(folder, signature)
+        except _CacheMiss:
+            misses.append(name)
+
+    if misses:
+        workers = min(len(misses), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # The dashboard never shows the cleaned frame, so the workers
+            # do not send it back.
+            jobs = {
+                name: executor.submit(process_dataset, keys[name][0], include_df=False)
+                for name in misses
+            }
+            for name, job in jobs.items():
+                folder, signature = keys[name]
+                try:
+                    results[name] = _cached_process(folder, signature, _job=job)
+                except Exception as e:
+                    results[name] = e
+    return results
+
+
+def render_dataset(name: str, result):
+    st.header(f"Results for {name}")
+
+    if isinstance(result, Exception):
+        st.error(f"Error while processing {name}: {result}")
         return
-    df = result.get("df")
     daily_revenue_raw = result.get("daily_revenue")
     top5_days_raw = result.get("top5_days")
     unique_users = result.get("unique_users", 0)
@@ -62,13 +138,12 @@ def render_dataset(name: str, folder: str):
     with col1:
         st.subheader("Top 5 Days by Revenue (YYYY-MM-DD)")
         if top5_days is not None and not top5_days.empty:
-            top5_display = top5_days.copy()
+            top5_display = top5_days
 
             if "date" in top5_display.columns:
-                top5_display["date"] = top5_display["date"].astype(str)
-                top5_display = top5_display.rename(
-                    columns={"date": "Date"}
-                )
+                top5_display = top5_display.assign(
+                    date=top5_display["date"].astype(str)
+                ).rename(columns={"date": "Date"})
             if "revenue_usd" in top5_display.columns:
                 top5_display = top5_display.rename(
                     columns={"revenue_usd": "Revenue (USD)"}
@@ -109,11 +184,12 @@ def render_dataset(name: str, folder: str):
 
     st.subheader("Daily Revenue Chart (USD)")
     if daily_revenue is not None and not daily_revenue.empty:
-        chart_df = daily_revenue.copy()
+        chart_df = daily_revenue
 
         if "date" in chart_df.columns:
-            chart_df["date"] = pd.to_datetime(chart_df["date"])
-            chart_df = chart_df.set_index("date")
+            chart_df = chart_df.assign(
+                date=pd.to_datetime(chart_df["date"])
+            ).set_index("date")
 
         if "revenue_usd" in chart_df.columns:
             st.line_chart(chart_df["revenue_usd"])
@@ -130,13 +206,15 @@ def render_dataset(name: str, folder: str):
 def main():
     st.title("Book Store Analytics")
 
+    results = _load_results()
+
     tab1, tab2, tab3 = st.tabs(["DATA1", "DATA2", "DATA3"])
     with tab1:
-        render_dataset("DATA1", DATASETS["DATA1"])
+        render_dataset("DATA1", results["DATA1"])
     with tab2:
-        render_dataset("DATA2", DATASETS["DATA2"])
+        render_dataset("DATA2", results["DATA2"])
     with tab3:
-        render_dataset("DATA3", DATASETS["DATA3"])
+        render_dataset("DATA3", results["DATA3"])
 
 
 if __name__ == "__main__":
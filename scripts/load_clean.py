@@ -8,8 +8,49 @@ try:
 except ImportError: 
     yaml = None
 
+# libyaml's C parser when PyYAML was built with it, pure Python otherwise.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
 EUR_TO_USD = 1.07
 
+# The only orders columns load_and_clean reads; everything else is skipped at
+# read time.
+ORDER_COLUMNS = ("user_id", "book_id", "quantity", "unit_price", "timestamp")
+
+# Regex sources shared by the per-value helpers and the column parsers. The
+# pandas .str methods take the pattern strings, which run on Arrow's regex
+# engine; the per-value helpers use the compiled versions below.
+_USD_PATTERN = r"USD|\$"
+_DECIMAL_MARK_PATTERN = r"[¢,]"
+_NON_NUMERIC_PATTERN = r"[^0-9.]"
+_AMPM_DOTS_PATTERN = r"(?i)([ap])\.?\s?m\.?"
+_SEP_PATTERN = r"[;,]"
+_WS_PATTERN = r"\s+"
+
+_USD_RE = re.compile(_USD_PATTERN, re.IGNORECASE)
+_DECIMAL_MARK_RE = re.compile(_DECIMAL_MARK_PATTERN)
+_NON_NUMERIC_RE = re.compile(_NON_NUMERIC_PATTERN)
+_AMPM_DOTS_RE = re.compile(_AMPM_DOTS_PATTERN)
+_SEP_RE = re.compile(_SEP_PATTERN)
+_WS_RE = re.compile(_WS_PATTERN)
+
+
+def _clean_timestamp_strings(raw: pd.Series) -> pd.Series:
+    """Column version of clean_timestamp."""
+    return (
+        raw.str.strip()
+        .str.replace(_AMPM_DOTS_PATTERN, r"\1M", regex=True)
+        .str.title()
+        .str.replace(_SEP_PATTERN, " ", regex=True)
+        .str.replace(_WS_PATTERN, " ", regex=True)
+        .str.rstrip(".")
+    )
+
 
 def clean_timestamp(ts):
     """Normalize messy timestamp strings before parsing."""
@@ -18,24 +59,15 @@ def clean_timestamp(ts):
 
     ts = ts.strip()
 
-    ts = re.sub(
-        r"\b([aA][mM]|[pP][mM])\.?\b",
-        lambda m: m.group(1).upper(),
-        ts,
-    )
-    ts = re.sub(
-        r"([ap])\.?\s?m\.?",
-        lambda m: m.group(1).upper() + "M",
-        ts,
-        flags=re.IGNORECASE,
-    )
+    # am/pm spellings ("a.m.", "p m", "PM.") become "AM"/"PM" here and then
+    # "Am"/"Pm" after title(), which pd.to_datetime accepts.
+    ts = _AMPM_DOTS_RE.sub(lambda m: m.group(1).upper() + "M", ts)
 
     ts = ts.title()
 
-    ts = ts.replace(";", " ")
-    ts = ts.replace(",", " ")
+    ts = _SEP_RE.sub(" ", ts)
 
-    ts = re.sub(r"\s+", " ", ts)
+    ts = _WS_RE.sub(" ", ts)
 
     ts = ts.rstrip(".")
 
@@ -60,6 +92,31 @@ def parse_timestamp(ts):
     except Exception as e:
         raise ValueError(f"Unknown timestamp: {raw} → {cleaned}") from e
 
+
+def parse_timestamp_series(values: pd.Series) -> pd.Series:
+    """
+    Parse a whole column of raw timestamps.
+
+    Cleans every string with pandas string kernels and parses them in one
+    pd.to_datetime call instead of once per row. Raises ValueError for a
+    timestamp that cannot be parsed.
+    """
+    raw = values.astype("string")
+    cleaned = _clean_timestamp_strings(raw)
+
+    parsed = pd.to_datetime(cleaned, errors="coerce", dayfirst=True, format="mixed")
+
+    # An empty cleaned string parses to NaT, not an error.
+    failed = (parsed.isna() & cleaned.fillna("").ne("")).to_numpy()
+    if failed.any():
+        pos = failed.argmax()
+        raise ValueError(
+            f"Unknown timestamp: {raw.iloc[pos]} → {cleaned.iloc[pos]}"
+        )
+
+    return parsed
+
+
 def parse_price_to_usd(value):
     """
     Parse strings like:
@@ -73,27 +130,13 @@ def parse_price_to_usd(value):
     if not s:
         return np.nan
 
-    original = s
-    upper = s.upper()
-    if "USD" in upper or "$" in s:
-        currency = "USD"
-    elif "EUR" in upper or "€" in s:
-        currency = "EUR"
-    else:
-        currency = "EUR"
-
-    s_num = original
-    for token in ["USD", "EUR", "$", "€"]:
-        s_num = s_num.replace(token, "")
-
-    s_num = s_num.replace("¢", ".")
-    s_num = s_num.replace(",", ".")
+    is_usd = _USD_RE.search(s) is not None
 
-    s_num = re.sub(r"[^0-9.]", "", s_num)
+    # Currency tokens go with everything else that is not a digit or a dot.
+    s_num = _NON_NUMERIC_RE.sub("", _DECIMAL_MARK_RE.sub(".", s))
 
-    if s_num.count(".") > 1:
-        parts = s_num.split(".")
-        s_num = "".join(parts[:-1]) + "." + parts[-1]
+    head, dot, tail = s_num.rpartition(".")
+    s_num = head.replace(".", "") + dot + tail
 
     if s_num == "":
         return np.nan
@@ -103,39 +146,255 @@ def parse_price_to_usd(value):
     except Exception:
         return np.nan
 
-    if currency == "USD":
-        return val
+    return val if is_usd else val * EUR_TO_USD
+
+
+def parse_price_series_to_usd(values: pd.Series) -> pd.Series:
+    """
+    Parse a whole column of raw prices (see parse_price_to_usd) into float USD.
+
+    Runs a handful of regex passes over the column instead of calling
+    Python once per row. Prices without a USD marker are treated as EUR.
+    """
+    s = values.astype("string").str.strip()
+
+    is_usd = s.str.contains(_USD_PATTERN, case=False, regex=True, na=False)
+
+    s_num = s.str.replace(_DECIMAL_MARK_PATTERN, ".", regex=True).str.replace(
+        _NON_NUMERIC_PATTERN, "", regex=True
+    )
+
+    # Only the last dot is the decimal point. str.rpartition runs per row, so
+    # just the few values with several dots go through it.
+    multi_dot = s_num.str.count(r"\.").gt(1).fillna(False).to_numpy(dtype=bool)
+    if multi_dot.any():
+        parts = s_num[multi_dot].str.rpartition(".")
+        s_num[multi_dot] = (
+            parts[0].str.replace(".", "", regex=False) + parts[1] + parts[2]
+        )
+
+    val = pd.to_numeric(s_num, errors="coerce").to_numpy(dtype=float)
+
+    # One multiply by a per-row rate looked up from the USD flag (0 = EUR,
+    # 1 = USD), instead of converting every price and then selecting between
+    # the two arrays.
+    rate = np.array([EUR_TO_USD, 1.0])[is_usd.to_numpy(dtype=np.int8)]
+
+    return pd.Series(val * rate, index=values.index, dtype=float)
+
+
+def _parse_unique(values: pd.Series, parse) -> pd.Series:
+    """
+    Run a column parser on the distinct values of `values` only and
+    broadcast the results back to every row (missing values stay missing).
+    """
+    codes, uniques = pd.factorize(values)
+    parsed = parse(pd.Series(uniques))
+    return pd.Series(parsed.array.take(codes, allow_fill=True), index=values.index)
+
+
+def _read_csv_fast(path: str, **kwargs) -> pd.DataFrame:
+    """
+    Read a CSV with pyarrow's multithreaded parser, falling back to the
+    default C parser if pyarrow is missing or rejects the file.
+    """
+    try:
+        return pd.read_csv(path, engine="pyarrow", **kwargs)
+    except (ImportError, ValueError):
+        return pd.read_csv(path, **kwargs)
+
+
+def _clean_orders(orders: pd.DataFrame) -> pd.DataFrame:
+    """Parse timestamps and prices and derive the per-order columns."""
+    if "timestamp" not in orders.columns:
+        raise KeyError("orders file has no 'timestamp' column")
+
+    if not pd.api.types.is_datetime64_any_dtype(orders["timestamp"]):
+        orders["timestamp"] = _parse_unique(
+            orders["timestamp"], parse_timestamp_series
+        )
+    # Midnight-normalized datetime64 rather than datetime.date objects, so the
+    # daily groupby hashes int64 values instead of Python objects.
+    orders["date"] = orders["timestamp"].dt.normalize()
+
+    if "unit_price" not in orders.columns:
+        raise KeyError("orders file has no 'unit_price' column")
+
+    orders["unit_price_usd"] = _parse_unique(
+        orders["unit_price"], parse_price_series_to_usd
+    )
+    orders["quantity"] = pd.to_numeric(
+        orders.get("quantity", 1), errors="coerce"
+    ).fillna(0).astype(float)
+    orders["paid_price_usd"] = np.multiply(
+        orders["unit_price_usd"].to_numpy(dtype=np.float64),
+        orders["quantity"].to_numpy(dtype=np.float64),
+    )
+
+    if "user_id" not in orders.columns:
+        raise KeyError("orders file has no 'user_id' column")
+    orders["user_key"] = orders["user_id"].astype("string[pyarrow]")
+
+    if "book_id" in orders.columns:
+        orders["book_id"] = pd.to_numeric(
+            orders["book_id"], errors="coerce"
+        ).astype("Int64")
     else:
-        return val * EUR_TO_USD
+        orders["book_id"] = pd.arrays.IntegerArray([pd.NA] * len(orders))
+
+    return orders
+
+
+def _load_orders(orders_path: str) -> pd.DataFrame:
+    """Read the ORDER_COLUMNS of an orders CSV or Parquet file and clean them."""
+    if orders_path.lower().endswith(".csv"):
+        header = pd.read_csv(orders_path, nrows=0).columns
+        # Keep timestamps as raw strings: pyarrow would otherwise parse ISO
+        # columns itself and skip the dayfirst handling in parse_timestamp_series.
+        orders = _read_csv_fast(
+            orders_path,
+            usecols=[c for c in header if c in ORDER_COLUMNS],
+            dtype={"timestamp": str},
+        )
+        return _clean_orders(orders)
+
+    columns = None
+    if pq is not None:
+        names = pq.read_schema(orders_path).names
+        columns = [c for c in names if c in ORDER_COLUMNS]
+    return _clean_orders(pd.read_parquet(orders_path, columns=columns))
+
+
+# Bump whenever the books normalization changes, so caches written by older
+# code are rebuilt instead of served.
+_BOOKS_CACHE_VERSION = "1"
+
+
+def _books_cache_paths(books_path: str):
+    """Parquet cache for a books YAML file and the sidecar holding its stamp."""
+    cache_path = os.path.splitext(books_path)[0] + ".parquet"
+    return cache_path, cache_path + ".mtime"
+
+
+def _books_cache_stamp(books_path: str) -> str:
+    """Cache format version plus the YAML file's mtime."""
+    return f"{_BOOKS_CACHE_VERSION}:{os.stat(books_path).st_mtime_ns}"
+
+
+def _read_books_cache(books_path: str):
+    """Return the cached [book_id, author_set] frame, or None if it is stale."""
+    cache_path, stamp_path = _books_cache_paths(books_path)
+    try:
+        with open(stamp_path, "r", encoding="utf-8") as f:
+            stamp = f.read().strip()
+        if stamp != _books_cache_stamp(books_path):
+            return None
+        return pd.read_parquet(cache_path)
+    except (OSError, ValueError, ImportError):
+        return None
+
+
+def _replace_file(path: str, write) -> None:
+    """Write `path` through a temporary file so readers never see half of it."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _write_books_cache(books_path: str, books: pd.DataFrame, stamp: str) -> None:
+    """
+    Best-effort write of the books cache; a read-only folder is not an error.
+
+    `stamp` must be taken before the YAML file was read, so an edit made
+    while it was parsed leaves the new cache stale instead of looking fresh.
+    """
+    cache_path, stamp_path = _books_cache_paths(books_path)
+
+    def write_stamp(path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(stamp)
+
+    try:
+        # Drop the old stamp first: a reader must not pair it with the new
+        # Parquet file.
+        if os.path.exists(stamp_path):
+            os.remove(stamp_path)
+        _replace_file(
+            cache_path, lambda path: books.to_parquet(path, index=False)
+        )
+        _replace_file(stamp_path, write_stamp)
+    except (OSError, ValueError, ImportError):
+        pass
+
+
+def _project_yaml_books(records) -> pd.DataFrame:
+    """
+    Build only the id and author columns from parsed YAML book records.
+
+    Keys may be Ruby-style symbols (':id', ':author'); all other fields
+    (title, genre, ...) are skipped instead of becoming DataFrame columns.
+    """
+    book_ids = []
+    authors = []
+    has_author = False
+
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        fields = {str(k).strip().lstrip(":"): v for k, v in record.items()}
+        book_ids.append(fields.get("book_id", fields.get("id")))
+
+        author_key = next(
+            (k for k in fields if k.lower() in ("author", "authors")), None
+        )
+        if author_key is not None:
+            has_author = True
+        authors.append(fields.get(author_key))
+
+    books = pd.DataFrame({"book_id": book_ids})
+    if has_author:
+        books["author"] = authors
+    return books
 
 
 def _load_books(books_path: str) -> pd.DataFrame:
-    """Load books from CSV or YAML and normalize to [book_id, author_set]."""
+    """
+    Load books from CSV or YAML and normalize to [book_id, author_set].
+
+    The normalized YAML catalog is cached as books.parquet next to the YAML
+    file and reused for as long as the YAML file's mtime and
+    _BOOKS_CACHE_VERSION are unchanged.
+    """
     if books_path is None:
         return pd.DataFrame(columns=["book_id", "author_set"])
 
     lower = books_path.lower()
+    is_yaml = lower.endswith(".yml") or lower.endswith(".yaml")
+
+    if is_yaml:
+        cached = _read_books_cache(books_path)
+        if cached is not None:
+            return cached
 
     if lower.endswith(".csv"):
-        books = pd.read_csv(books_path)
-    elif lower.endswith(".yml") or lower.endswith(".yaml"):
+        books = _read_csv_fast(books_path)
+    elif is_yaml:
         if yaml is None:
             raise ImportError(
                 "PyYAML is required to read books.yml. Install it with 'pip install pyyaml'."
             )
+        stamp = _books_cache_stamp(books_path)
         with open(books_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or []
-        books = pd.DataFrame(data)
+            data = yaml.load(f, Loader=_YAML_LOADER) or []
+        books = _project_yaml_books(data)
     else:
         return pd.DataFrame(columns=["book_id", "author_set"])
     
-    orig_cols = list(books.columns)
-    norm_cols = []
-    for c in orig_cols:
-        c_str = str(c).strip()
-        c_str = c_str.lstrip(":")  
-        norm_cols.append(c_str)
-    books.columns = norm_cols
+    books.columns = books.columns.astype(str).str.strip().str.lstrip(":")
 
     if "book_id" not in books.columns and "id" in books.columns:
         books = books.rename(columns={"id": "book_id"})
@@ -161,76 +420,72 @@ def _load_books(books_path: str) -> pd.DataFrame:
         books["book_id"] = np.nan
 
     books["book_id"] = pd.to_numeric(books["book_id"], errors="coerce").astype("Int64")
+    books = books[["book_id", "author_set"]]
+
+    if is_yaml:
+        _write_books_cache(books_path, books, stamp)
 
-    return books[["book_id", "author_set"]]
+    return books
+
+
+def dataset_file_kind(fname: str):
+    """
+    Return "books" or "orders" for a dataset input file name, else None.
+
+    Other files in the folder, such as the books Parquet cache, are not
+    inputs.
+    """
+    lower = fname.lower()
+    if lower.startswith("book") and lower.endswith((".csv", ".yml", ".yaml")):
+        return "books"
+    if lower.startswith("order") and lower.endswith((".csv", ".parquet")):
+        return "orders"
+    return None
 
 
 def load_and_clean(folder_path: str) -> pd.DataFrame:
     """
-    Load users (optional), books, and orders from DATA1/2/3,
+    Load books and orders from DATA1/2/3,
     clean them, and return a unified DataFrame with:
       user_id, user_key, book_id, timestamp, date,
       unit_price_usd, paid_price_usd, author_set, revenue_usd
     """
-    users_path = None
     books_path = None
     orders_path = None
 
     for fname in os.listdir(folder_path):
-        lower = fname.lower()
+        kind = dataset_file_kind(fname)
         full = os.path.join(folder_path, fname)
 
-        if lower.startswith("user") and lower.endswith(".csv"):
-            users_path = full
-        elif lower.startswith("book") and (
-            lower.endswith(".csv") or lower.endswith(".yml") or lower.endswith(".yaml")
-        ):
+        if kind == "books":
             books_path = full
-        elif lower.startswith("order") and (
-            lower.endswith(".csv") or lower.endswith(".parquet")
-        ):
+        elif kind == "orders":
             orders_path = full
 
     if orders_path is None:
         raise FileNotFoundError(f"No orders file found in {folder_path}")
 
-    if users_path and os.path.exists(users_path):
-        _ = pd.read_csv(users_path)  
-
     books = _load_books(books_path)
-
-    if orders_path.lower().endswith(".csv"):
-        orders = pd.read_csv(orders_path)
-    else:
-        orders = pd.read_parquet(orders_path)
-
-    if "timestamp" not in orders.columns:
-        raise KeyError("orders file has no 'timestamp' column")
-
-    orders["timestamp"] = orders["timestamp"].apply(parse_timestamp)
-    orders["date"] = orders["timestamp"].dt.date
-
-    if "unit_price" not in orders.columns:
-        raise KeyError("orders file has no 'unit_price' column")
-
-    orders["unit_price_usd"] = orders["unit_price"].apply(parse_price_to_usd)
-    orders["quantity"] = pd.to_numeric(
-        orders.get("quantity", 1), errors="coerce"
-    ).fillna(0).astype(float)
-    orders["paid_price_usd"] = orders["unit_price_usd"] * orders["quantity"]
-
-    if "user_id" not in orders.columns:
-        raise KeyError("orders file has no 'user_id' column")
-    orders["user_key"] = orders["user_id"].astype(str)
-
-    if "book_id" in orders.columns:
-        orders["book_id"] = pd.to_numeric(
-            orders["book_id"], errors="coerce"
-        ).astype("Int64")
-    else:
-        orders["book_id"] = pd.arrays.IntegerArray([pd.NA] * len(orders))
-
-    df = orders.merge(books, on="book_id", how="left")
+    # Author names repeat across books and orders; as a categorical the join
+    # below gathers small integer codes instead of copying strings per row.
+    books["author_set"] = books["author_set"].astype("category")
+
+    orders = _load_orders(orders_path)
+
+    # Books whose id is missing or non-numeric cannot be ordered by id; drop
+    # them so only real duplicate ids count as a broken catalog.
+    books = books.dropna(subset=["book_id"])
+
+    # book_id is unique in the catalog, so the join is a lookup of each
+    # order's catalog row followed by one gather of author_set; orders with
+    # an unknown book get -1, which take() turns into a missing value.
+    catalog_ids = pd.Index(books["book_id"])
+    if not catalog_ids.is_unique:
+        raise ValueError("books file has duplicate book_id values")
+    positions = catalog_ids.get_indexer(orders["book_id"])
+
+    df = orders
+    df["author_set"] = books["author_set"].array.take(positions, allow_fill=True)
 
     df["revenue_usd"] = df["paid_price_usd"]
 
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from load_clean import (
+    EUR_TO_USD,
+    _parse_unique,
+    parse_price_series_to_usd,
+    parse_price_to_usd,
+    parse_timestamp,
+    parse_timestamp_series,
+)
+
+PRICE_EDGE_CASES = ["49€99¢", "€43¢75", "1..2", "1.2.3", "", "   ", None, 12.5, "usd 5"]
+
+
+def test_price_series_matches_parse_price_to_usd():
+    values = pd.Series(PRICE_EDGE_CASES, dtype=object)
+
+    parsed = parse_price_series_to_usd(values)
+
+    expected = np.array([parse_price_to_usd(v) for v in PRICE_EDGE_CASES], dtype=float)
+    np.testing.assert_array_equal(parsed.to_numpy(), expected)
+    assert parsed.index.equals(values.index)
+
+
+def test_price_edge_case_values():
+    parsed = parse_price_series_to_usd(pd.Series(PRICE_EDGE_CASES, dtype=object))
+
+    assert parsed.tolist()[:4] == [
+        4999 * EUR_TO_USD,
+        43.75 * EUR_TO_USD,
+        1.2 * EUR_TO_USD,
+        12.3 * EUR_TO_USD,
+    ]
+    assert parsed.iloc[4:7].isna().all()
+    assert parsed.iloc[7] == 12.5 * EUR_TO_USD
+    assert parsed.iloc[8] == 5.0
+
+
+def test_parse_unique_matches_parsing_every_row():
+    values = pd.Series(PRICE_EDGE_CASES * 2, index=range(10, 28), dtype=object)
+
+    parsed = _parse_unique(values, parse_price_series_to_usd)
+
+    direct = parse_price_series_to_usd(values)
+    assert parsed.index.equals(values.index)
+    np.testing.assert_array_equal(parsed.to_numpy(dtype=float), direct.to_numpy())
+
+
+TIMESTAMP_CASES = [
+    "12/03/2024 5:30 p.m.",
+    "12/03/2024 5 P M.",
+    "2024-03-12 10am",
+    "12/03/2024;10:15",
+    "12/03/2024, 10:15",
+    "2024-03-12T08:00:00",
+]
+
+
+def test_timestamp_series_matches_parse_timestamp():
+    parsed = parse_timestamp_series(pd.Series(TIMESTAMP_CASES))
+
+    assert parsed.tolist() == [parse_timestamp(v) for v in TIMESTAMP_CASES]
+
+
+def test_timestamp_ampm_and_separators():
+    parsed = parse_timestamp_series(pd.Series(TIMESTAMP_CASES[:5]))
+
+    assert parsed.iloc[0] == pd.Timestamp("2024-03-12 17:30")
+    assert parsed.iloc[1] == pd.Timestamp("2024-03-12 17:00")
+    assert parsed.iloc[2].hour == 10
+    assert parsed.iloc[3] == pd.Timestamp("2024-03-12 10:15")
+    assert parsed.iloc[4] == pd.Timestamp("2024-03-12 10:15")
+
+
+def test_timestamp_blank_and_missing_are_nat():
+    values = ["", "   ", None, pd.NA, np.nan]
+
+    parsed = parse_timestamp_series(pd.Series(values, dtype=object))
+
+    assert parsed.isna().all()
+    assert all(parse_timestamp(v) is pd.NaT for v in values)
+
+
+def test_timestamp_garbage_raises():
+    with pytest.raises(ValueError, match="Unknown timestamp: not a date"):
+        parse_timestamp_series(pd.Series(["12/03/2024 10:15", "not a date"]))
+    with pytest.raises(ValueError, match="Unknown timestamp: not a date"):
+        parse_timestamp("not a date")